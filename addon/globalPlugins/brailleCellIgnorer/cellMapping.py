@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import braille
+import config
 
 from . import config as cellIgnorerConfig
 
@@ -19,7 +20,13 @@ class CellMappingManager:
 	"""
 
 	def __init__(self):
-		self._ignoredCells: set[int] = set()
+		# Bit i is set when the 0-based physical cell i is ignored.
+		self._ignoredMask: int = 0
+		self._ignoredCellsKey: tuple[int, ...] = ()
+		self._physicalToLogical: list[int | None] = []
+		self._logicalToPhysical: list[int] = []
+		self._remapRuns: list[tuple[int, int, int]] = []
+		self._mappingKey: tuple[tuple[int, ...], int] | None = None
 		self._originalRoutingIndexProperty: property | None = None
 		self._originalWriteCells = None
 		self._originalRouteTo = None
@@ -30,6 +37,8 @@ class CellMappingManager:
 		if self._isRegistered:
 			return
 		braille.filter_displayDimensions.register(self._filterDisplayDimensions)
+		config.post_configProfileSwitch.register(self._onConfigChanged)
+		config.post_configReset.register(self._onConfigChanged)
 		self._patchWriteCells()
 		self._patchRoutingIndex()
 		self._patchRouteTo()
@@ -41,6 +50,8 @@ class CellMappingManager:
 		if not self._isRegistered:
 			return
 		braille.filter_displayDimensions.unregister(self._filterDisplayDimensions)
+		config.post_configProfileSwitch.unregister(self._onConfigChanged)
+		config.post_configReset.unregister(self._onConfigChanged)
 		self._unpatchWriteCells()
 		self._unpatchRoutingIndex()
 		self._unpatchRouteTo()
@@ -50,11 +61,20 @@ class CellMappingManager:
 	def refreshIgnoredCells(self) -> None:
 		"""Refresh ignored cells and trigger display update.
 
-		The actual _ignoredCells will be updated when _filterDisplayDimensions
+		The actual _ignoredMask will be updated when _filterDisplayDimensions
 		is called during the display refresh cycle.
 		"""
+		cellIgnorerConfig.invalidateCache()
 		self._refreshDisplay()
 
+	def _onConfigChanged(self) -> None:
+		"""Handle NVDA configuration profile switches and resets.
+
+		The active configuration may now hold different profiles, so cached
+		profiles must be discarded.
+		"""
+		self.refreshIgnoredCells()
+
 	def _refreshDisplay(self) -> None:
 		"""Invalidate display dimensions cache and trigger update."""
 		if not braille.handler or not braille.handler.display:
@@ -77,13 +97,51 @@ class CellMappingManager:
 		"""
 		display = braille.handler.display if braille.handler else None
 		ignoredList = cellIgnorerConfig.getIgnoredCellsForDisplay(display)
-		self._ignoredCells = set(ignoredList)
-		if not self._ignoredCells or displayDimensions.numRows > 1:
+		self._ignoredCellsKey = tuple(ignoredList)
+		self._updateIndexMapping(displayDimensions.numCols)
+		if not self._ignoredMask or displayDimensions.numRows > 1:
 			return displayDimensions
-		validIgnoredCount = sum(1 for cell in self._ignoredCells if 0 <= cell < displayDimensions.numCols)
-		newNumCols = max(0, displayDimensions.numCols - validIgnoredCount)
+		# Every physical cell that is not ignored holds exactly one logical cell.
+		newNumCols = len(self._logicalToPhysical)
 		return braille.DisplayDimensions(numRows=1, numCols=newNumCols)
 
+	def _updateIndexMapping(self, physicalCellCount: int) -> None:
+		"""Rebuild the ignored cell mask and index lookup tables if the ignored cells changed.
+
+		:param physicalCellCount: The number of physical cells in the braille row.
+		"""
+		mappingKey = (self._ignoredCellsKey, physicalCellCount)
+		if mappingKey == self._mappingKey:
+			return
+		self._mappingKey = mappingKey
+		self._physicalToLogical = []
+		self._logicalToPhysical = []
+		self._remapRuns = []
+		# Cells beyond the display never affect the output, so keep them out of the mask.
+		ignoredMask = 0
+		for cell in self._ignoredCellsKey:
+			if 0 <= cell < physicalCellCount:
+				ignoredMask |= 1 << cell
+		self._ignoredMask = ignoredMask
+		if not ignoredMask:
+			return
+		for physicalIndex in range(physicalCellCount):
+			if (ignoredMask >> physicalIndex) & 1:
+				self._physicalToLogical.append(None)
+			else:
+				self._physicalToLogical.append(len(self._logicalToPhysical))
+				self._logicalToPhysical.append(physicalIndex)
+		# Group consecutive usable cells into (physicalStart, logicalStart, length) runs.
+		logicalToPhysical = self._logicalToPhysical
+		runStart = 0
+		for logicalIndex in range(1, len(logicalToPhysical) + 1):
+			if (
+				logicalIndex == len(logicalToPhysical)
+				or logicalToPhysical[logicalIndex] != logicalToPhysical[logicalIndex - 1] + 1
+			):
+				self._remapRuns.append((logicalToPhysical[runStart], runStart, logicalIndex - runStart))
+				runStart = logicalIndex
+
 	def _patchWriteCells(self) -> None:
 		"""Patch BrailleHandler._writeCells to remap cells for ignored positions."""
 		self._originalWriteCells = braille.BrailleHandler._writeCells
@@ -91,6 +149,9 @@ class CellMappingManager:
 
 		def patchedWriteCells(handler: braille.BrailleHandler, cells: list[int]) -> None:
 			"""Patched _writeCells that remaps logical cells to physical positions."""
+			if not manager._ignoredMask:
+				# Nothing to remap, write the cells exactly as NVDA would.
+				return manager._originalWriteCells(handler, cells)
 			logicalCellCount = handler.displaySize
 			braille.pre_writeCells.notify(
 				cells=cells,
@@ -101,25 +162,24 @@ class CellMappingManager:
 			if not display or not display.numCells:
 				return
 			physicalCellCount = display.numCells
-			ignoredCells = manager._ignoredCells
-			if ignoredCells and handler.displayDimensions.numRows == 1:
+			numRows = handler.displayDimensions.numRows
+			if numRows == 1:
 				cells = handler._normalizeCellArraySize(
 					cells,
 					logicalCellCount,
-					handler.displayDimensions.numRows,
+					numRows,
 					logicalCellCount,
-					handler.displayDimensions.numRows,
+					numRows,
 				)
 				cells = manager._remapCellsToPhysical(
 					cells,
 					physicalCellCount,
-					ignoredCells,
 				)
 			else:
 				cells = handler._normalizeCellArraySize(
 					cells,
 					logicalCellCount,
-					handler.displayDimensions.numRows,
+					numRows,
 					physicalCellCount,
 					display.numRows,
 				)
@@ -149,28 +209,36 @@ class CellMappingManager:
 		self,
 		logicalCells: list[int],
 		physicalCellCount: int,
-		ignoredCells: set[int],
 	) -> list[int]:
 		"""Remap logical cells to physical display positions.
 
 		Inserts blank cells at ignored positions.
+		Relies on the ignored cell mask and index tables that
+		_filterDisplayDimensions keeps current for the display.
 
 		:param logicalCells: The logical cell values from the braille buffer.
 		:param physicalCellCount: The total number of physical cells on the display.
-		:param ignoredCells: 0-based indices of cells to ignore.
 		:return: Cell values for physical display.
 		"""
-		physicalCells: list[int] = []
+		physicalCells = [0] * physicalCellCount
+		if len(self._physicalToLogical) == physicalCellCount:
+			logicalCellCount = len(self._logicalToPhysical)
+			if len(logicalCells) < logicalCellCount:
+				logicalCells = logicalCells + [0] * (logicalCellCount - len(logicalCells))
+			for physicalStart, logicalStart, length in self._remapRuns:
+				physicalCells[physicalStart : physicalStart + length] = logicalCells[
+					logicalStart : logicalStart + length
+				]
+			return physicalCells
+		ignoredMask = self._ignoredMask
+		logicalCellCount = len(logicalCells)
 		logicalIndex = 0
 		for physicalIndex in range(physicalCellCount):
-			if physicalIndex in ignoredCells:
-				physicalCells.append(0)
-			else:
-				if logicalIndex < len(logicalCells):
-					physicalCells.append(logicalCells[logicalIndex])
-				else:
-					physicalCells.append(0)
-				logicalIndex += 1
+			if (ignoredMask >> physicalIndex) & 1:
+				continue
+			if logicalIndex < logicalCellCount:
+				physicalCells[physicalIndex] = logicalCells[logicalIndex]
+			logicalIndex += 1
 		return physicalCells
 
 	def _patchRoutingIndex(self) -> None:
@@ -230,8 +298,12 @@ class CellMappingManager:
 		:param physicalIndex: The physical cell index pressed.
 		:return: The logical cell index, or None if the cell is ignored.
 		"""
-		ignoredCells = self._ignoredCells
-		if physicalIndex in ignoredCells:
+		ignoredMask = self._ignoredMask
+		if not ignoredMask:
+			return physicalIndex
+		if physicalIndex < len(self._physicalToLogical):
+			return self._physicalToLogical[physicalIndex]
+		if (ignoredMask >> physicalIndex) & 1:
 			return None
-		ignoredBefore = sum(1 for cell in ignoredCells if cell < physicalIndex)
+		ignoredBefore = (ignoredMask & ((1 << physicalIndex) - 1)).bit_count()
 		return physicalIndex - ignoredBefore
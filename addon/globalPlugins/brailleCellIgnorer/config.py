@@ -18,28 +18,39 @@ if TYPE_CHECKING:
 _CONFIG_SECTION = "brailleCellIgnorer"
 _CONFIG_PROFILES_KEY = "profiles"
 
+_profilesCache: dict[str, IgnoredCellsProfile] | None = None
+_ignoredCellsCache: dict[tuple[str, int], list[int]] = {}
 
-@dataclass
+
+@dataclass(frozen=True)
 class IgnoredCellsProfile:
 	"""Ignored cell configuration for a specific braille display.
 
+	Profiles are immutable; use :func:`dataclasses.replace` to derive a changed profile.
+
 	:ivar driverName: The braille display driver name.
 	:ivar numCells: The number of cells the display has.
 	:ivar ignoredCells: 1-based indices of cells to ignore.
+	:ivar key: The configuration key for this profile.
 	"""
 
 	driverName: str
 	numCells: int
 	ignoredCells: list[int] = field(default_factory=list)
+	key: str = field(init=False)
+	_zeroBased: list[int] = field(init=False, repr=False, compare=False)
 
-	@property
-	def key(self) -> str:
-		"""Return the configuration key for this profile."""
-		return f"{self.driverName}:{self.numCells}"
+	def __post_init__(self) -> None:
+		"""Compute derived attributes once, as the profile cannot change afterwards."""
+		object.__setattr__(self, "key", f"{self.driverName}:{self.numCells}")
+		object.__setattr__(self, "_zeroBased", [cell - 1 for cell in self.ignoredCells if cell > 0])
 
 	def getIgnoredCellsZeroBased(self) -> list[int]:
-		"""Return the ignored cells as 0-based indices."""
-		return [cell - 1 for cell in self.ignoredCells if cell > 0]
+		"""Return the ignored cells as 0-based indices.
+
+		The returned list is shared and must not be modified.
+		"""
+		return self._zeroBased
 
 
 def _getConfigSection():
@@ -49,11 +60,24 @@ def _getConfigSection():
 	return config.conf[_CONFIG_SECTION]
 
 
+def invalidateCache() -> None:
+	"""Discard cached profiles so the next lookup re-reads the configuration."""
+	global _profilesCache
+	_profilesCache = None
+	_ignoredCellsCache.clear()
+
+
 def loadProfiles() -> dict[str, IgnoredCellsProfile]:
 	"""Load all ignored cell profiles from configuration.
 
+	The result is cached until :func:`invalidateCache` is called or profiles are saved.
+	Callers that modify the returned dictionary must copy it first.
+
 	:return: Dictionary mapping profile keys to IgnoredCellsProfile objects.
 	"""
+	global _profilesCache
+	if _profilesCache is not None:
+		return _profilesCache
 	profiles: dict[str, IgnoredCellsProfile] = {}
 	try:
 		section = _getConfigSection()
@@ -69,6 +93,8 @@ def loadProfiles() -> dict[str, IgnoredCellsProfile]:
 					continue
 	except Exception:
 		log.error("Error loading brailleCellIgnorer config", exc_info=True)
+		return profiles
+	_profilesCache = profiles
 	return profiles
 
 
@@ -114,6 +140,7 @@ def saveProfiles(profiles: dict[str, IgnoredCellsProfile]) -> None:
 		if profile.ignoredCells:
 			profilesData[key] = list(profile.ignoredCells)
 	section[_CONFIG_PROFILES_KEY] = profilesData
+	invalidateCache()
 
 
 def getActiveProfile(display: "braille.BrailleDisplayDriver | None") -> IgnoredCellsProfile | None:
@@ -135,7 +162,14 @@ def getIgnoredCellsForDisplay(display: "braille.BrailleDisplayDriver | None") ->
 	:param display: The current braille display driver, or None.
 	:return: List of 0-based cell indices to ignore.
 	"""
-	profile = getActiveProfile(display)
-	if profile:
-		return profile.getIgnoredCellsZeroBased()
-	return []
+	if not display or display.name == "noBraille":
+		return []
+	cacheKey = (display.name, display.numCells)
+	ignoredCells = _ignoredCellsCache.get(cacheKey)
+	if ignoredCells is None:
+		profile = getActiveProfile(display)
+		ignoredCells = profile.getIgnoredCellsZeroBased() if profile else []
+		# Profiles are not cached when loading failed; retry on the next refresh.
+		if _profilesCache is not None:
+			_ignoredCellsCache[cacheKey] = ignoredCells
+	return ignoredCells
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import re
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import wx
@@ -24,6 +26,8 @@ addonHandler.initTranslation()
 
 _cellManager: "CellMappingManager | None" = None
 
+_VALID_INPUT_RE = re.compile(r"[0-9, ]*")
+
 
 def register(cellManager: "CellMappingManager") -> None:
 	"""Register the settings panel with NVDA settings dialog.
@@ -67,15 +71,20 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 		"""
 		helper = guiHelper.BoxSizerHelper(self, sizer=sizer)
 
-		self._profiles: dict[str, cellIgnorerConfig.IgnoredCellsProfile] = cellIgnorerConfig.loadProfiles()
+		self._profiles: dict[str, cellIgnorerConfig.IgnoredCellsProfile] = dict(
+			cellIgnorerConfig.loadProfiles(),
+		)
 		self._pendingChanges: dict[str, list[int]] = {}
+		self._cellsDisplayStrings: dict[str, str] = {}
 		self._currentDisplayKey: str | None = None
+		self._currentMaxCells: int = 0
 		self._profileKeys: list[str] = []
 		self._selectedIndex: int = -1
 
 		display = braille.handler.display if braille.handler else None
 		if display and display.name != "noBraille":
 			self._currentDisplayKey = f"{display.name}:{display.numCells}"
+			self._currentMaxCells = display.numCells
 
 		choices = self._buildProfileList()
 
@@ -138,18 +147,17 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 					ignoredCells=[],
 				)
 
-		for key, profile in self._profiles.items():
-			if key == self._currentDisplayKey:
-				continue
-			if not profile.ignoredCells:
-				continue
-			self._profileKeys.append(key)
-			# Translators: Combo box item for a historical display profile
-			# {name} is the driver name, {cells} is the cell count
-			label = _("{name} ({cells} cells)").format(
-				name=profile.driverName,
-				cells=profile.numCells,
-			)
+		historicalProfiles = [
+			profile
+			for key, profile in self._profiles.items()
+			if profile.ignoredCells and key != self._currentDisplayKey
+		]
+		# Translators: Combo box item for a historical display profile
+		# {name} is the driver name, {cells} is the cell count
+		historicalLabel = _("{name} ({cells} cells)")
+		for profile in historicalProfiles:
+			self._profileKeys.append(profile.key)
+			label = historicalLabel.format_map({"name": profile.driverName, "cells": profile.numCells})
 			choices.append(label)
 
 		return choices
@@ -167,8 +175,26 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 		key = self._profileKeys[self._selectedIndex]
 		if key == self._currentDisplayKey:
 			cells, _ = self._parseCellsFromInput()
-			if cells is not None:
+			if cells is not None and self._pendingChanges.get(key) != cells:
 				self._pendingChanges[key] = cells
+				self._cellsDisplayStrings.pop(key, None)
+
+	def _getCellsDisplayString(self, key: str) -> str:
+		"""Get the comma-separated ignored cells of a profile for display.
+
+		:param key: The profile key.
+		:return: The ignored cells, including pending changes, as a string.
+		"""
+		cellsStr = self._cellsDisplayStrings.get(key)
+		if cellsStr is None:
+			if key in self._pendingChanges:
+				cells = self._pendingChanges[key]
+			else:
+				profile = self._profiles.get(key)
+				cells = profile.ignoredCells if profile else []
+			cellsStr = ", ".join(str(c) for c in cells)
+			self._cellsDisplayStrings[key] = cellsStr
+		return cellsStr
 
 	def _updateUIState(self) -> None:
 		"""Update UI controls based on current selection."""
@@ -182,17 +208,10 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 
 		key = self._profileKeys[self._selectedIndex]
 		isCurrentDisplay = key == self._currentDisplayKey
-
-		if key in self._pendingChanges:
-			cells = self._pendingChanges[key]
-		else:
-			profile = self._profiles.get(key)
-			cells = profile.ignoredCells if profile else []
-
-		cellsStr = ", ".join(str(c) for c in cells)
+		cellsStr = self._getCellsDisplayString(key)
 
 		if isCurrentDisplay:
-			maxCells = self._getCurrentDisplayCellCount()
+			maxCells = self._currentMaxCells
 			if maxCells:
 				# Translators: Label for ignored cells input with valid range
 				# {max} is the maximum valid cell number
@@ -226,6 +245,7 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 			del self._profiles[key]
 		if key in self._pendingChanges:
 			del self._pendingChanges[key]
+		self._cellsDisplayStrings.pop(key, None)
 		self._profileKeys.pop(self._selectedIndex)
 		self._profileChoice.Delete(self._selectedIndex)
 		if self._profileChoice.GetCount() > 0:
@@ -247,12 +267,11 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 		if not text:
 			return [], None
 
-		allowedChars = set("0123456789, ")
-		if not all(c in allowedChars for c in text):
+		if not _VALID_INPUT_RE.fullmatch(text):
 			# Translators: Error when input contains invalid characters
 			return None, _("Only numbers and commas are allowed.")
 
-		maxCells = self._getCurrentDisplayCellCount()
+		maxCells = self._currentMaxCells
 		cells: list[int] = []
 		outOfRange: list[int] = []
 
@@ -285,16 +304,6 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 
 		return sorted(set(cells)), None
 
-	def _getCurrentDisplayCellCount(self) -> int:
-		"""Get the cell count of the currently connected display.
-
-		:return: Number of cells, or 0 if no display connected.
-		"""
-		if not self._currentDisplayKey:
-			return 0
-		profile = self._profiles.get(self._currentDisplayKey)
-		return profile.numCells if profile else 0
-
 	def isValid(self) -> bool:
 		"""Validate the current settings.
 
@@ -320,7 +329,7 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 		self._saveCurrentEdits()
 		for key, cells in self._pendingChanges.items():
 			if key in self._profiles:
-				self._profiles[key].ignoredCells = cells
+				self._profiles[key] = replace(self._profiles[key], ignoredCells=cells)
 			elif cells:
 				parts = key.split(":", 1)
 				self._profiles[key] = cellIgnorerConfig.IgnoredCellsProfile(
@@ -336,3 +345,4 @@ class BrailleCellIgnorerSettingsPanel(settingsDialogs.SettingsPanel):
 	def onDiscard(self) -> None:
 		"""Handle discard when Cancel is pressed."""
 		self._pendingChanges.clear()
+		self._cellsDisplayStrings.clear()